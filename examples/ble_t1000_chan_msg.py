@@ -17,6 +17,6 @@ async def main () :
 #    mc = MeshCore(con)
 #    await mc.connect()
 
-    await mc.commands.send_chan_msg(0, MSG)
+    await mc.commands.send_chan_msg(0, MSG, await_response=False)
 
 asyncio.run(main())
@@ -19,6 +19,6 @@ async def main () :
     if contact is None:
         print(f"Contact '{DEST}' not found in contacts.")
         return
-    await mc.commands.send_msg(contact,MSG)
+    await mc.commands.send_msg(contact, MSG, await_response=False)
 
 asyncio.run(main())
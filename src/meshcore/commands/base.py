@@ -1,7 +1,8 @@
 import asyncio
 import logging
 import random
-from typing import Any, Callable, Coroutine, Dict, List, Optional, Union
+from functools import lru_cache
+from typing import Any, Callable, Coroutine, Dict, List, Optional, Tuple, Union
 
 from ..events import Event, EventDispatcher, EventType
 from ..reader import MessageReader
@@ -11,6 +12,47 @@ DestinationType = Union[bytes, str, Dict[str, Any]]
 
 logger = logging.getLogger("meshcore")
 
+# Expected responses shared by most commands
+_OK_ERR = (EventType.OK, EventType.ERROR)
+_MSG_SENT_ERR = (EventType.MSG_SENT, EventType.ERROR)
+
+
+@lru_cache(maxsize=256)
+def _hex_prefix(hex_str: str, prefix_length: int) -> bytes:
+    """Decode a hex public key and truncate it, memoized for repeated destinations"""
+    return bytes.fromhex(hex_str)[:prefix_length]
+
+
+def _from_bytes(dst: bytes, prefix_length: int) -> bytes:
+    # Already bytes, use directly and only slice when longer than the prefix
+    return dst if len(dst) <= prefix_length else dst[:prefix_length]
+
+
+def _from_str(dst: str, prefix_length: int) -> bytes:
+    # Hex string, convert to bytes
+    try:
+        return _hex_prefix(dst, prefix_length)
+    except ValueError as e:
+        raise ValueError(f"Invalid public key hex string: {dst}") from e
+
+
+def _from_dict(dst: Dict[str, Any], prefix_length: int) -> bytes:
+    # Contact object, extract public_key
+    if "public_key" not in dst:
+        raise ValueError("Contact object must have a 'public_key' field")
+    try:
+        return _hex_prefix(dst["public_key"], prefix_length)
+    except ValueError as e:
+        raise ValueError(f"Invalid public_key in contact: {dst['public_key']}") from e
+
+
+# Exact-type dispatch for destinations, subclasses go through isinstance
+_DST_HANDLERS: Dict[type, Callable[[Any, int], bytes]] = {
+    bytes: _from_bytes,
+    str: _from_str,
+    dict: _from_dict,
+}
+
 
 def _validate_destination(dst: DestinationType, prefix_length: int = 6) -> bytes:
     """
@@ -28,27 +70,17 @@ def _validate_destination(dst: DestinationType, prefix_length: int = 6) -> bytes
     Raises:
         ValueError: If dst is invalid or doesn't contain required fields
     """
-    if isinstance(dst, bytes):
-        # Already bytes, use directly
-        return dst[:prefix_length]
-    elif isinstance(dst, str):
-        # Hex string, convert to bytes
-        try:
-            return bytes.fromhex(dst)[:prefix_length]
-        except ValueError:
-            raise ValueError(f"Invalid public key hex string: {dst}")
-    elif isinstance(dst, dict):
-        # Contact object, extract public_key
-        if "public_key" not in dst:
-            raise ValueError("Contact object must have a 'public_key' field")
-        try:
-            return bytes.fromhex(dst["public_key"])[:prefix_length]
-        except ValueError:
-            raise ValueError(f"Invalid public_key in contact: {dst['public_key']}")
-    else:
-        raise ValueError(
-            f"Destination must be a public key string or contact object, got: {type(dst)}"
-        )
+    handler = _DST_HANDLERS.get(type(dst))
+    if handler is not None:
+        return handler(dst, prefix_length)
+
+    for dst_type, handler in _DST_HANDLERS.items():
+        if isinstance(dst, dst_type):
+            return handler(dst, prefix_length)
+
+    raise ValueError(
+        f"Destination must be a public key string or contact object, got: {type(dst)}"
+    )
 
 
 class CommandHandlerBase:
@@ -63,10 +95,7 @@ class CommandHandlerBase:
         )
 
     def set_connection(self, connection: Any) -> None:
-        async def sender(data: bytes) -> None:
-            await connection.send(data)
-
-        self._sender_func = sender
+        self._sender_func = connection.send
 
     def set_reader(self, reader: MessageReader) -> None:
         self._reader = reader
@@ -77,62 +106,52 @@ class CommandHandlerBase:
     async def send(
         self,
         data: bytes,
-        expected_events: Optional[Union[EventType, List[EventType]]] = None,
+        expected_events: Optional[
+            Union[EventType, List[EventType], Tuple[EventType, ...]]
+        ] = None,
         timeout: Optional[float] = None,
+        await_response: bool = True,
     ) -> Event:
         """
         Send a command and wait for expected event responses.
 
         Args:
-            data: The data to send
-            expected_events: EventType or list of EventTypes to wait for
+            data: The data to send, bytes-like objects are copied to bytes
+            expected_events: EventType or list/tuple of EventTypes to wait for
             timeout: Timeout in seconds, or None to use default_timeout
+            await_response: If False, return as soon as the data is written
+                without waiting for expected_events
 
         Returns:
             Event: The full event object that was received in response to the command
         """
-        if not self.dispatcher:
+        dispatcher = self.dispatcher
+        if not dispatcher:
             raise RuntimeError("Dispatcher not set, cannot send commands")
 
         # Use the provided timeout or fall back to default_timeout
         timeout = timeout if timeout is not None else self.default_timeout
 
-        if self._sender_func:
-            logger.debug(
-                f"Sending raw data: {data.hex() if isinstance(data, bytes) else data}"
-            )
-            await self._sender_func(data)
+        sender = self._sender_func
+        if sender:
+            if type(data) is not bytes:
+                # Connections always get immutable bytes
+                data = bytes(data)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(f"Sending raw data: {data.hex()}")
+            await sender(data)
 
-        if expected_events:
+        if expected_events and await_response:
             try:
-                # Convert single event to list if needed
-                if not isinstance(expected_events, list):
-                    expected_events = [expected_events]
-
-                logger.debug(f"Waiting for events {expected_events}, timeout={timeout}")
-
-                # Create futures for all expected events
-                futures = []
-                for event_type in expected_events:
-                    future = asyncio.create_task(
-                        self.dispatcher.wait_for_event(event_type, {}, timeout)
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug(
+                        f"Waiting for events {expected_events}, timeout={timeout}"
                     )
-                    futures.append(future)
-
-                # Wait for the first event to complete or all to timeout
-                done, pending = await asyncio.wait(
-                    futures, timeout=timeout, return_when=asyncio.FIRST_COMPLETED
-                )
-
-                # Cancel all pending futures
-                for future in pending:
-                    future.cancel()
-
-                # Check if any future completed successfully
-                for future in done:
-                    event = await future
-                    if event:
-                        return event
+
+                # Wait for the first of the expected events, without attribute filters
+                event = await dispatcher.wait_for_event(expected_events, None, timeout)
+                if event:
+                    return event
 
                 # Create an error event when no event is received
                 return Event(EventType.ERROR, {"reason": "no_event_received"})
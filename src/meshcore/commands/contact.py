@@ -1,63 +1,81 @@
 import logging
+import struct
 from typing import Optional
 
 from ..events import Event, EventType
-from .base import CommandHandlerBase, DestinationType, _validate_destination
+from .base import (
+    CommandHandlerBase,
+    DestinationType,
+    _OK_ERR,
+    _validate_destination,
+)
 
 logger = logging.getLogger("meshcore")
 
+_CMD_GET_CONTACTS = b"\x04"
+_CMD_EXPORT_CONTACT = b"\x11"
+
+_U32LE = struct.Struct("<I")
+# type(1) + flags(1) + out_path_len(1)
+_CONTACT_INFO = struct.Struct("<BBb")
+# last_advert(4) + adv_lat(4) + adv_lon(4)
+_CONTACT_ADVERT = struct.Struct("<Iii")
+
 
 class ContactCommands(CommandHandlerBase):
-    async def get_contacts(self, lastmod=0) -> Event:
+    async def get_contacts(self, lastmod: int = 0) -> Event:
         logger.debug("Getting contacts")
-        data = b"\x04"
+        data = _CMD_GET_CONTACTS
         if lastmod > 0:
-            data = data + lastmod.to_bytes(4, "little")
+            data = data + _U32LE.pack(lastmod)
         return await self.send(data, [EventType.CONTACTS, EventType.ERROR])
 
     async def reset_path(self, key: DestinationType) -> Event:
         key_bytes = _validate_destination(key, prefix_length=32)
-        logger.debug(f"Resetting path for contact: {key_bytes.hex()}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"Resetting path for contact: {key_bytes.hex()}")
         data = b"\x0d" + key_bytes
-        return await self.send(data, [EventType.OK, EventType.ERROR])
+        return await self.send(data, _OK_ERR)
 
     async def share_contact(self, key: DestinationType) -> Event:
         key_bytes = _validate_destination(key, prefix_length=32)
-        logger.debug(f"Sharing contact: {key_bytes.hex()}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"Sharing contact: {key_bytes.hex()}")
         data = b"\x10" + key_bytes
-        return await self.send(data, [EventType.OK, EventType.ERROR])
+        return await self.send(data, _OK_ERR)
 
     async def export_contact(self, key: Optional[DestinationType] = None) -> Event:
         if key:
             key_bytes = _validate_destination(key, prefix_length=32)
-            logger.debug(f"Exporting contact: {key_bytes.hex()}")
-            data = b"\x11" + key_bytes
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(f"Exporting contact: {key_bytes.hex()}")
+            data = _CMD_EXPORT_CONTACT + key_bytes
         else:
             logger.debug("Exporting node")
-            data = b"\x11"
+            data = _CMD_EXPORT_CONTACT
         return await self.send(data, [EventType.CONTACT_URI, EventType.ERROR])
 
-    async def import_contact(self, card_data) -> Event:
+    async def import_contact(self, card_data: bytes) -> Event:
         data = b"\x12" + card_data
-        return await self.send(data, [EventType.OK, EventType.ERROR])
+        return await self.send(data, _OK_ERR)
 
     async def remove_contact(self, key: DestinationType) -> Event:
         key_bytes = _validate_destination(key, prefix_length=32)
-        logger.debug(f"Removing contact: {key_bytes.hex()}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"Removing contact: {key_bytes.hex()}")
         data = b"\x0f" + key_bytes
-        return await self.send(data, [EventType.OK, EventType.ERROR])
+        return await self.send(data, _OK_ERR)
 
     async def update_contact(self, contact, path=None, flags=None) -> Event:
         if path is None:
-            out_path_hex = contact["out_path"]
+            out_path = bytes.fromhex(contact["out_path"])
             out_path_len = contact["out_path_len"]
         else:
-            out_path_hex = path
-            out_path_len = int(len(path) / 2)
+            out_path = bytes.fromhex(path)
+            out_path_len = len(out_path)
             # reflect the change
-            contact["out_path"] = out_path_hex
+            contact["out_path"] = path
             contact["out_path_len"] = out_path_len
-        out_path_hex = out_path_hex + (128 - len(out_path_hex)) * "0"
 
         if flags is None:
             flags = contact["flags"]
@@ -65,21 +83,23 @@ class ContactCommands(CommandHandlerBase):
             # reflect the change
             contact["flags"] = flags
 
-        adv_name_hex = contact["adv_name"].encode().hex()
-        adv_name_hex = adv_name_hex + (64 - len(adv_name_hex)) * "0"
-        data = (
-            b"\x09"
-            + bytes.fromhex(contact["public_key"])
-            + contact["type"].to_bytes(1)
-            + flags.to_bytes(1)
-            + out_path_len.to_bytes(1, "little", signed=True)
-            + bytes.fromhex(out_path_hex)
-            + bytes.fromhex(adv_name_hex)
-            + contact["last_advert"].to_bytes(4, "little")
-            + int(contact["adv_lat"] * 1e6).to_bytes(4, "little", signed=True)
-            + int(contact["adv_lon"] * 1e6).to_bytes(4, "little", signed=True)
+        # Path and name are zero padded to 64 and 32 bytes
+        name_bytes = contact["adv_name"].encode("utf-8")[:32]
+        data = b"".join(
+            (
+                b"\x09",
+                bytes.fromhex(contact["public_key"]),
+                _CONTACT_INFO.pack(contact["type"], flags, out_path_len),
+                out_path.ljust(64, b"\x00"),
+                name_bytes.ljust(32, b"\x00"),
+                _CONTACT_ADVERT.pack(
+                    contact["last_advert"],
+                    int(contact["adv_lat"] * 1e6),
+                    int(contact["adv_lon"] * 1e6),
+                ),
+            )
         )
-        return await self.send(data, [EventType.OK, EventType.ERROR])
+        return await self.send(data, _OK_ERR)
 
     async def add_contact(self, contact) -> Event:
         return await self.update_contact(contact)
@@ -1,90 +1,99 @@
 import logging
+import struct
 from typing import Optional
 
 from ..events import Event, EventType
-from .base import CommandHandlerBase, DestinationType, _validate_destination
+from .base import (
+    CommandHandlerBase,
+    DestinationType,
+    _OK_ERR,
+    _validate_destination,
+)
 
 logger = logging.getLogger("meshcore")
 
+# Static command payloads
+_CMD_APPSTART = b"\x01\x03      mccli"
+_CMD_DEVICE_QUERY = b"\x16\x03"
+_CMD_ADVERT = b"\x07"
+_CMD_ADVERT_FLOOD = b"\x07\x01"
+_CMD_REBOOT = b"\x13reboot"
+_CMD_GET_BAT = b"\x14"
+_CMD_GET_TIME = b"\x05"
+_CMD_GET_SELF_TELEMETRY = b"\x27\x00\x00\x00"
+_CMD_GET_CUSTOM_VARS = b"\x28"
+
+# Numeric command payloads
+_COORDS = struct.Struct("<iiI")
+_U32LE = struct.Struct("<I")
+_RADIO = struct.Struct("<IIBB")
+_TUNING = struct.Struct("<IIBB")
+
 
 class DeviceCommands(CommandHandlerBase):
     async def send_appstart(self) -> Event:
         logger.debug("Sending appstart command")
-        b1 = bytearray(b"\x01\x03      mccli")
-        return await self.send(b1, [EventType.SELF_INFO])
+        return await self.send(_CMD_APPSTART, [EventType.SELF_INFO])
 
     async def send_device_query(self) -> Event:
         logger.debug("Sending device query command")
-        return await self.send(b"\x16\x03", [EventType.DEVICE_INFO, EventType.ERROR])
+        return await self.send(
+            _CMD_DEVICE_QUERY, [EventType.DEVICE_INFO, EventType.ERROR]
+        )
 
-    async def send_advert(self, flood: bool = False) -> Event:
+    async def send_advert(
+        self, flood: bool = False, await_response: bool = True
+    ) -> Event:
         logger.debug(f"Sending advertisement command (flood={flood})")
-        if flood:
-            return await self.send(b"\x07\x01", [EventType.OK, EventType.ERROR])
-        else:
-            return await self.send(b"\x07", [EventType.OK, EventType.ERROR])
+        data = _CMD_ADVERT_FLOOD if flood else _CMD_ADVERT
+        return await self.send(data, _OK_ERR, await_response=await_response)
 
     async def set_name(self, name: str) -> Event:
-        logger.debug(f"Setting device name to: {name}")
-        return await self.send(
-            b"\x08" + name.encode("utf-8"), [EventType.OK, EventType.ERROR]
-        )
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"Setting device name to: {name}")
+        return await self.send(b"\x08" + name.encode("utf-8"), _OK_ERR)
 
     async def set_coords(self, lat: float, lon: float) -> Event:
-        logger.debug(f"Setting coordinates to: lat={lat}, lon={lon}")
-        return await self.send(
-            b"\x0e"
-            + int(lat * 1e6).to_bytes(4, "little", signed=True)
-            + int(lon * 1e6).to_bytes(4, "little", signed=True)
-            + int(0).to_bytes(4, "little"),
-            [EventType.OK, EventType.ERROR],
-        )
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"Setting coordinates to: lat={lat}, lon={lon}")
+        data = b"\x0e" + _COORDS.pack(int(lat * 1e6), int(lon * 1e6), 0)
+        return await self.send(data, _OK_ERR)
 
     async def reboot(self) -> Event:
         logger.debug("Sending reboot command")
-        return await self.send(b"\x13reboot")
+        return await self.send(_CMD_REBOOT)
 
     async def get_bat(self) -> Event:
         logger.debug("Getting battery information")
-        return await self.send(b"\x14", [EventType.BATTERY, EventType.ERROR])
+        return await self.send(_CMD_GET_BAT, [EventType.BATTERY, EventType.ERROR])
 
     async def get_time(self) -> Event:
         logger.debug("Getting device time")
-        return await self.send(b"\x05", [EventType.CURRENT_TIME, EventType.ERROR])
+        return await self.send(_CMD_GET_TIME, [EventType.CURRENT_TIME, EventType.ERROR])
 
     async def set_time(self, val: int) -> Event:
         logger.debug(f"Setting device time to: {val}")
-        return await self.send(
-            b"\x06" + int(val).to_bytes(4, "little"), [EventType.OK, EventType.ERROR]
-        )
+        return await self.send(b"\x06" + _U32LE.pack(int(val)), _OK_ERR)
 
     async def set_tx_power(self, val: int) -> Event:
         logger.debug(f"Setting TX power to: {val}")
-        return await self.send(
-            b"\x0c" + int(val).to_bytes(4, "little"), [EventType.OK, EventType.ERROR]
-        )
+        return await self.send(b"\x0c" + _U32LE.pack(int(val)), _OK_ERR)
 
     async def set_radio(self, freq: float, bw: float, sf: int, cr: int) -> Event:
-        logger.debug(f"Setting radio params: freq={freq}, bw={bw}, sf={sf}, cr={cr}")
-        return await self.send(
-            b"\x0b"
-            + int(float(freq) * 1000).to_bytes(4, "little")
-            + int(float(bw) * 1000).to_bytes(4, "little")
-            + int(sf).to_bytes(1, "little")
-            + int(cr).to_bytes(1, "little"),
-            [EventType.OK, EventType.ERROR],
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                f"Setting radio params: freq={freq}, bw={bw}, sf={sf}, cr={cr}"
+            )
+        data = b"\x0b" + _RADIO.pack(
+            int(float(freq) * 1000), int(float(bw) * 1000), int(sf), int(cr)
         )
+        return await self.send(data, _OK_ERR)
 
     async def set_tuning(self, rx_dly: int, af: int) -> Event:
-        logger.debug(f"Setting tuning params: rx_dly={rx_dly}, af={af}")
-        return await self.send(
-            b"\x15"
-            + int(rx_dly).to_bytes(4, "little")
-            + int(af).to_bytes(4, "little")
-            + int(0).to_bytes(1, "little")
-            + int(0).to_bytes(1, "little"),
-            [EventType.OK, EventType.ERROR],
-        )
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"Setting tuning params: rx_dly={rx_dly}, af={af}")
+        data = b"\x15" + _TUNING.pack(int(rx_dly), int(af), 0, 0)
+        return await self.send(data, _OK_ERR)
 
     async def set_other_params(
         self,
@@ -105,7 +114,7 @@ class DeviceCommands(CommandHandlerBase):
             + telemetry_mode.to_bytes(1)
             + advert_loc_policy.to_bytes(1)
         )
-        return await self.send(data, [EventType.OK, EventType.ERROR])
+        return await self.send(data, _OK_ERR)
 
     async def set_telemetry_mode_base(self, telemetry_mode_base: int) -> Event:
         infos = (await self.send_appstart()).payload
@@ -159,24 +168,24 @@ class DeviceCommands(CommandHandlerBase):
 
     async def set_devicepin(self, pin: int) -> Event:
         logger.debug(f"Setting device PIN to: {pin}")
-        return await self.send(
-            b"\x25" + int(pin).to_bytes(4, "little"), [EventType.OK, EventType.ERROR]
-        )
+        return await self.send(b"\x25" + _U32LE.pack(int(pin)), _OK_ERR)
 
     async def get_self_telemetry(self) -> Event:
         logger.debug("Getting self telemetry")
-        data = b"\x27\x00\x00\x00"
-        return await self.send(data, [EventType.TELEMETRY_RESPONSE, EventType.ERROR])
+        return await self.send(
+            _CMD_GET_SELF_TELEMETRY, [EventType.TELEMETRY_RESPONSE, EventType.ERROR]
+        )
 
     async def get_custom_vars(self) -> Event:
         logger.debug("Asking for custom vars")
-        data = b"\x28"
-        return await self.send(data, [EventType.CUSTOM_VARS, EventType.ERROR])
+        return await self.send(
+            _CMD_GET_CUSTOM_VARS, [EventType.CUSTOM_VARS, EventType.ERROR]
+        )
 
-    async def set_custom_var(self, key, value) -> Event:
+    async def set_custom_var(self, key: str, value: str) -> Event:
         logger.debug(f"Setting custom var {key} to {value}")
-        data = b"\x29" + key.encode("utf-8") + b":" + value.encode("utf-8")
-        return await self.send(data, [EventType.OK, EventType.ERROR])
+        data = b"".join((b"\x29", key.encode("utf-8"), b":", value.encode("utf-8")))
+        return await self.send(data, _OK_ERR)
 
     async def get_channel(self, channel_idx: int) -> Event:
         logger.debug(f"Getting channel info for channel {channel_idx}")
@@ -196,5 +205,7 @@ class DeviceCommands(CommandHandlerBase):
         if len(channel_secret) != 16:
             raise ValueError("Channel secret must be exactly 16 bytes")
 
-        data = b"\x20" + channel_idx.to_bytes(1, "little") + name_bytes + channel_secret
-        return await self.send(data, [EventType.OK, EventType.ERROR])
+        data = b"".join(
+            (b"\x20", channel_idx.to_bytes(1, "little"), name_bytes, channel_secret)
+        )
+        return await self.send(data, _OK_ERR)
@@ -1,113 +1,142 @@
 import logging
 import random
-from typing import Optional, Union
+import struct
+import time
+from typing import Callable, Optional, Union
 
 from ..events import Event, EventType
-from .base import CommandHandlerBase, DestinationType, _validate_destination
+from .base import (
+    CommandHandlerBase,
+    DestinationType,
+    _OK_ERR,
+    _MSG_SENT_ERR,
+    _validate_destination,
+)
 
 logger = logging.getLogger("meshcore")
 
+_CMD_SYNC_NEXT_MESSAGE = b"\x0a"
+
+# Replies to CMD_SYNC_NEXT_MESSAGE
+_GET_MSG_EVENTS = (
+    EventType.CONTACT_MSG_RECV,
+    EventType.CHANNEL_MSG_RECV,
+    EventType.ERROR,
+    EventType.NO_MORE_MSGS,
+)
+
+_time: Callable[[], float] = time.time
+
+# CMD_SEND_TRACE_PATH(1) + tag(4) + auth_code(4) + flags(1)
+_TRACE_HDR = struct.Struct("<BIIB")
+# CMD_SEND_TXT_MSG(1) + txt_type(1) + attempt(1) + timestamp(4)
+_MSG_HDR = struct.Struct("<BBBI")
+# CMD_SEND_CHANNEL_TXT_MSG(1) + txt_type(1) + channel_idx(1) + timestamp(4)
+_CHAN_HDR = struct.Struct("<BBBI")
+
 
 class MessagingCommands(CommandHandlerBase):
     async def get_msg(self, timeout: Optional[float] = None) -> Event:
         logger.debug("Requesting pending messages")
-        return await self.send(
-            b"\x0a",
-            [
-                EventType.CONTACT_MSG_RECV,
-                EventType.CHANNEL_MSG_RECV,
-                EventType.ERROR,
-                EventType.NO_MORE_MSGS,
-            ],
-            timeout,
-        )
+        return await self.send(_CMD_SYNC_NEXT_MESSAGE, _GET_MSG_EVENTS, timeout)
 
     async def send_login(self, dst: DestinationType, pwd: str) -> Event:
         dst_bytes = _validate_destination(dst, prefix_length=32)
-        logger.debug(f"Sending login request to: {dst_bytes.hex()}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"Sending login request to: {dst_bytes.hex()}")
         data = b"\x1a" + dst_bytes + pwd.encode("utf-8")
-        return await self.send(data, [EventType.MSG_SENT, EventType.ERROR])
+        return await self.send(data, _MSG_SENT_ERR)
 
     async def send_logout(self, dst: DestinationType) -> Event:
         dst_bytes = _validate_destination(dst, prefix_length=32)
         data = b"\x1d" + dst_bytes
-        return await self.send(data, [EventType.OK, EventType.ERROR])
+        return await self.send(data, _OK_ERR)
 
     async def send_statusreq(self, dst: DestinationType) -> Event:
         dst_bytes = _validate_destination(dst, prefix_length=32)
-        logger.debug(f"Sending status request to: {dst_bytes.hex()}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"Sending status request to: {dst_bytes.hex()}")
         data = b"\x1b" + dst_bytes
-        return await self.send(data, [EventType.MSG_SENT, EventType.ERROR])
+        return await self.send(data, _MSG_SENT_ERR)
 
     async def send_cmd(
-        self, dst: DestinationType, cmd: str, timestamp: Optional[int] = None
+        self,
+        dst: DestinationType,
+        cmd: str,
+        timestamp: Optional[int] = None,
+        await_response: bool = True,
     ) -> Event:
         dst_bytes = _validate_destination(dst)
-        logger.debug(f"Sending command to {dst_bytes.hex()}: {cmd}")
-
-        if timestamp is None:
-            import time
-
-            timestamp = int(time.time())
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"Sending command to {dst_bytes.hex()}: {cmd}")
 
-        data = (
-            b"\x02\x01\x00"
-            + timestamp.to_bytes(4, "little")
-            + dst_bytes
-            + cmd.encode("utf-8")
-        )
-        return await self.send(data, [EventType.MSG_SENT, EventType.ERROR])
+        ts = int(_time()) if timestamp is None else timestamp
+        data = b"".join((_MSG_HDR.pack(2, 1, 0, ts), dst_bytes, cmd.encode("utf-8")))
+        return await self.send(data, _MSG_SENT_ERR, await_response=await_response)
 
     async def send_msg(
-        self, dst: DestinationType, msg: str, timestamp: Optional[int] = None
+        self,
+        dst: DestinationType,
+        msg: str,
+        timestamp: Optional[int] = None,
+        await_response: bool = True,
     ) -> Event:
         dst_bytes = _validate_destination(dst)
-        logger.debug(f"Sending message to {dst_bytes.hex()}: {msg}")
-
-        if timestamp is None:
-            import time
-
-            timestamp = int(time.time())
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"Sending message to {dst_bytes.hex()}: {msg}")
 
-        data = (
-            b"\x02\x00\x00"
-            + timestamp.to_bytes(4, "little")
-            + dst_bytes
-            + msg.encode("utf-8")
-        )
-        return await self.send(data, [EventType.MSG_SENT, EventType.ERROR])
+        ts = int(_time()) if timestamp is None else timestamp
+        data = b"".join((_MSG_HDR.pack(2, 0, 0, ts), dst_bytes, msg.encode("utf-8")))
+        return await self.send(data, _MSG_SENT_ERR, await_response=await_response)
 
-    async def send_chan_msg(self, chan, msg, timestamp=None) -> Event:
-        logger.debug(f"Sending channel message to channel {chan}: {msg}")
+    async def send_chan_msg(
+        self,
+        chan: int,
+        msg: str,
+        timestamp: Optional[Union[int, bytes]] = None,
+        await_response: bool = True,
+    ) -> Event:
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"Sending channel message to channel {chan}: {msg}")
 
         # Default to current time if timestamp not provided
         if timestamp is None:
-            import time
-
-            timestamp = int(time.time()).to_bytes(4, "little")
-
-        data = (
-            b"\x03\x00" + chan.to_bytes(1, "little") + timestamp + msg.encode("utf-8")
-        )
-        return await self.send(data, [EventType.OK, EventType.ERROR])
+            timestamp = int(_time())
+
+        if isinstance(timestamp, int):
+            data = _CHAN_HDR.pack(3, 0, chan, timestamp) + msg.encode("utf-8")
+        else:
+            # Raw 4 byte timestamp
+            data = b"".join(
+                (
+                    b"\x03\x00",
+                    chan.to_bytes(1, "little"),
+                    timestamp,
+                    msg.encode("utf-8"),
+                )
+            )
+        return await self.send(data, _OK_ERR, await_response=await_response)
 
     async def send_telemetry_req(self, dst: DestinationType) -> Event:
         dst_bytes = _validate_destination(dst, prefix_length=32)
-        logger.debug(f"Asking telemetry to {dst_bytes.hex()}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"Asking telemetry to {dst_bytes.hex()}")
         data = b"\x27\x00\x00\x00" + dst_bytes
-        return await self.send(data, [EventType.MSG_SENT, EventType.ERROR])
+        return await self.send(data, _MSG_SENT_ERR)
 
-    async def send_binary_req(self, dst: DestinationType, bin_data) -> Event:
+    async def send_binary_req(self, dst: DestinationType, bin_data: bytes) -> Event:
         dst_bytes = _validate_destination(dst, prefix_length=32)
-        logger.debug(f"Binary request to {dst_bytes.hex()}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"Binary request to {dst_bytes.hex()}")
         data = b"\x32" + dst_bytes + bin_data
-        return await self.send(data, [EventType.MSG_SENT, EventType.ERROR])
+        return await self.send(data, _MSG_SENT_ERR)
 
     async def send_path_discovery(self, dst: DestinationType) -> Event:
         dst_bytes = _validate_destination(dst, prefix_length=32)
-        logger.debug(f"Path discovery request for {dst_bytes.hex()}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"Path discovery request for {dst_bytes.hex()}")
         data = b"\x34\x00" + dst_bytes
-        return await self.send(data, [EventType.MSG_SENT, EventType.ERROR])
+        return await self.send(data, _MSG_SENT_ERR)
 
     async def send_trace(
         self,
@@ -135,33 +164,37 @@ class MessagingCommands(CommandHandlerBase):
         if auth_code is None:
             auth_code = random.randint(1, 0xFFFFFFFF)
 
-        logger.debug(
-            f"Sending trace: tag={tag}, auth={auth_code}, flags={flags}, path={path}"
-        )
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                f"Sending trace: tag={tag}, auth={auth_code}, flags={flags}, path={path}"
+            )
 
         # Prepare the command packet: CMD(1) + tag(4) + auth_code(4) + flags(1) + [path]
-        cmd_data = bytearray([36])  # CMD_SEND_TRACE_PATH
-        cmd_data.extend(tag.to_bytes(4, "little"))
-        cmd_data.extend(auth_code.to_bytes(4, "little"))
-        cmd_data.append(flags)
+        cmd_data = _TRACE_HDR.pack(36, tag, auth_code, flags)  # CMD_SEND_TRACE_PATH
 
         # Process path if provided
         if path:
             if isinstance(path, str):
-                # Convert comma-separated hex values to bytes
-                try:
-                    path_bytes = bytearray()
-                    for hex_val in path.split(","):
-                        hex_val = hex_val.strip()
-                        path_bytes.append(int(hex_val, 16))
-                    cmd_data.extend(path_bytes)
-                except ValueError as e:
-                    logger.error(f"Invalid path format: {e}")
-                    return Event(EventType.ERROR, {"reason": "invalid_path_format"})
+                # Convert comma-separated hex values to bytes, in one pass when
+                # every value is a two-digit byte
+                hex_vals = [hex_val.strip() for hex_val in path.split(",")]
+                path_bytes = None
+                if all(len(hex_val) == 2 for hex_val in hex_vals):
+                    try:
+                        path_bytes = bytes.fromhex("".join(hex_vals))
+                    except ValueError:
+                        pass
+                if path_bytes is None:
+                    try:
+                        path_bytes = bytes(int(hex_val, 16) for hex_val in hex_vals)
+                    except ValueError as e:
+                        logger.error(f"Invalid path format: {e}")
+                        return Event(EventType.ERROR, {"reason": "invalid_path_format"})
+                cmd_data += path_bytes
             elif isinstance(path, (bytes, bytearray)):
-                cmd_data.extend(path)
+                cmd_data += path
             else:
                 logger.error(f"Unsupported path type: {type(path)}")
                 return Event(EventType.ERROR, {"reason": "unsupported_path_type"})
 
-        return await self.send(cmd_data, [EventType.MSG_SENT, EventType.ERROR])
+        return await self.send(cmd_data, _MSG_SENT_ERR)
@@ -1,7 +1,7 @@
 from enum import Enum
 import inspect
 import logging
-from typing import Any, Dict, Optional, Callable, List, Union
+from typing import Any, Dict, Optional, Callable, List, Sequence, Union
 import asyncio
 from dataclasses import dataclass, field
 
@@ -143,6 +143,35 @@ class EventDispatcher:
     async def dispatch(self, event: Event):
         await self.queue.put(event)
 
+    async def dispatch_type(
+        self,
+        event_type: EventType,
+        payload: Any = None,
+        attributes: Optional[Dict[str, Any]] = None,
+    ):
+        """
+        Dispatch an event of the given type, building it only if it has a listener.
+
+        Subscriptions are checked when the event is queued rather than when it is
+        processed, so this is meant for unsolicited notifications, not for replies
+        a command may start waiting for after the reply was received.
+
+        Parameters:
+        -----------
+        event_type : EventType
+            The type of the event.
+        payload : Any, optional
+            The event payload, an empty dict if not given.
+        attributes : Dict[str, Any], optional
+            Event attributes used for filtering.
+        """
+        for subscription in self.subscriptions:
+            if subscription.event_type is None or subscription.event_type == event_type:
+                await self.queue.put(
+                    Event(event_type, {} if payload is None else payload, attributes)
+                )
+                return
+
     async def _process_events(self):
         while self.running:
             event = await self.queue.get()
@@ -204,7 +233,7 @@ class EventDispatcher:
 
     async def wait_for_event(
         self,
-        event_type: EventType,
+        event_type: Union[EventType, Sequence[EventType]],
         attribute_filters: Optional[Dict[str, Any]] = None,
         timeout: float | None = None,
     ) -> Optional[Event]:
@@ -213,8 +242,9 @@ class EventDispatcher:
 
         Parameters:
         -----------
-        event_type : EventType
-            The type of event to wait for.
+        event_type : EventType or list/tuple of EventType
+            The type of event to wait for. When several types are given, the first
+            matching event of any of them is returned.
         attribute_filters : Dict[str, Any], optional
             Dictionary of attribute key-value pairs that must match for the event to be returned.
         timeout : float | None, optional
@@ -230,11 +260,20 @@ class EventDispatcher:
             if not future.done():
                 future.set_result(event)
 
-        subscription = self.subscribe(event_type, event_handler, attribute_filters)
+        if isinstance(event_type, (list, tuple)):
+            subscriptions = [
+                self.subscribe(et, event_handler, attribute_filters)
+                for et in event_type
+            ]
+        else:
+            subscriptions = [
+                self.subscribe(event_type, event_handler, attribute_filters)
+            ]
 
         try:
             return await asyncio.wait_for(future, timeout)
         except asyncio.TimeoutError:
             return None
         finally:
-            subscription.unsubscribe()
+            for subscription in subscriptions:
+                subscription.unsubscribe()
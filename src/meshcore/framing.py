@@ -0,0 +1,67 @@
+"""
+Framing shared by the serial and TCP connections
+"""
+
+import asyncio
+import struct
+
+# Frame start marker (0x3c) followed by the 2-byte payload size
+_FRAME_HDR = struct.Struct("<BH")
+
+
+class _FrameParser:
+    """
+    Splits a byte stream into frames and hands each one to the reader.
+
+    Frames received from the device start with a 3 byte header, a marker byte
+    and the 2-byte little-endian payload size.
+    """
+
+    def __init__(self):
+        self.frame_started = False
+        self.frame_size = 0
+        self.header = bytearray()
+        self.inframe = bytearray()
+        self.reader = None
+
+    def set_reader(self, reader):
+        self.reader = reader
+
+    def handle_rx(self, data: bytearray):
+        # Walk the received chunk with a cursor, it may hold several frames
+        # or only part of one
+        mv = memoryview(data)
+        pos = 0
+        size = len(mv)
+        while pos < size:
+            if not self.frame_started and not self.header and size - pos >= 3:
+                # Whole frames in the chunk are handed over without buffering
+                end = pos + 3 + (mv[pos + 1] | (mv[pos + 2] << 8))
+                if end <= size:
+                    if self.reader is not None and end > pos + 3:
+                        frame = bytearray(mv[pos + 3 : end])
+                        asyncio.create_task(self.reader.handle_rx(frame))
+                    pos = end
+                    continue
+
+            if not self.frame_started:  # wait start of frame
+                take = min(3 - len(self.header), size - pos)
+                self.header.extend(mv[pos : pos + take])
+                pos += take
+                if len(self.header) < 3:
+                    break
+                self.frame_started = True
+                self.frame_size = self.header[1] | (self.header[2] << 8)
+
+            take = min(self.frame_size - len(self.inframe), size - pos)
+            self.inframe.extend(mv[pos : pos + take])
+            pos += take
+            if len(self.inframe) < self.frame_size:
+                break
+
+            if self.reader is not None and self.inframe:
+                asyncio.create_task(self.reader.handle_rx(self.inframe))
+            self.frame_started = False
+            self.header.clear()
+            # The completed frame is now owned by the reader task
+            self.inframe = bytearray()
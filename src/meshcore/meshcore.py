@@ -1,6 +1,18 @@
 import asyncio
 import logging
-from typing import Any, Callable, Coroutine, Dict, Optional, Union
+from bisect import bisect_left
+from operator import itemgetter
+from typing import (
+    Any,
+    Callable,
+    Coroutine,
+    Dict,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
 
 from .events import Event, EventDispatcher, EventType, Subscription
 from .reader import MessageReader
@@ -55,12 +67,18 @@ class MeshCore:
 
         # Initialize state (private)
         self._contacts = {}
+        # Lookup indexes over _contacts, rebuilt when contacts are received
+        self._contacts_by_name: Dict[str, Dict[str, Any]] = {}
+        self._contacts_by_key: List[Tuple[str, Dict[str, Any]]] = []
         self._contacts_dirty = True
         self._pending_contacts = {}
         self._self_info = {}
         self._time = 0
         self._lastmod = 0
         self._auto_update_contacts = False
+        self._auto_fetch_subscription: Optional[Subscription] = None
+        self._auto_fetch_running = False
+        self._auto_fetch_task: Optional[asyncio.Task] = None
 
         # Set up event subscriptions to track data
         self._setup_data_tracking()
@@ -170,7 +188,7 @@ class MeshCore:
         await self.dispatcher.stop()
 
         # Stop auto message fetching if it's running
-        if hasattr(self, "_auto_fetch_subscription") and self._auto_fetch_subscription:
+        if self._auto_fetch_subscription is not None:
             await self.stop_auto_message_fetching()
 
         # Disconnect the connection object
@@ -221,7 +239,7 @@ class MeshCore:
 
     async def wait_for_event(
         self,
-        event_type: EventType,
+        event_type: Union[EventType, Sequence[EventType]],
         attribute_filters: Optional[Dict[str, Any]] = None,
         timeout: Optional[float] = None,
     ) -> Optional[Event]:
@@ -229,7 +247,8 @@ class MeshCore:
         Wait for an event using EventType enum with optional attribute filtering
 
         Args:
-            event_type: Type of event to wait for, from EventType enum
+            event_type: Type of event to wait for, from EventType enum, or a list of
+                types to return the first one received
             attribute_filters: Dictionary of attribute key-value pairs to match against the event
             timeout: Maximum time to wait in seconds, or None to use default_timeout
 
@@ -262,6 +281,7 @@ class MeshCore:
                     self._contacts[c["public_key"]].update(c)
                 else:
                     self._contacts[c["public_key"]] = c
+            self._index_contacts()
             if "lastmod" in event.attributes:
                 self._lastmod = event.attributes["lastmod"]
             self._contacts_dirty = False
@@ -289,6 +309,25 @@ class MeshCore:
         self.subscribe(EventType.ADVERTISEMENT, _contact_change)
         self.subscribe(EventType.PATH_UPDATE, _contact_change)
 
+    def _index_contacts(self):
+        """Rebuild the name and public key lookup indexes from _contacts"""
+        by_name = {}
+        for contact in self._contacts.values():
+            # First contact with a given name wins, as with a linear scan
+            by_name.setdefault(contact.get("adv_name", "").lower(), contact)
+        self._contacts_by_name = by_name
+        self._contacts_by_key = sorted(
+            (
+                (contact.get("public_key", "").lower(), contact)
+                for contact in self._contacts.values()
+            ),
+            key=itemgetter(0),
+        )
+
+    def _is_current_contact(self, contact: Dict[str, Any]) -> bool:
+        """Check that an indexed contact is still the one held in _contacts"""
+        return self._contacts.get(contact.get("public_key")) is contact
+
     # Getter methods for state
     @property
     def contacts(self) -> Dict[str, Any]:
@@ -354,12 +393,22 @@ class MeshCore:
 
         Returns:
             Contact dictionary or None if not found
+
+        Note:
+            Lookups go through an index built on each CONTACTS event. If the
+            contacts were changed since then, the search falls back to a scan.
         """
-        if not self._contacts:
-            return None
+        name = name.lower()
+        contact = self._contacts_by_name.get(name)
+        if (
+            contact is not None
+            and self._is_current_contact(contact)
+            and contact.get("adv_name", "").lower() == name
+        ):
+            return contact
 
-        for _, contact in self._contacts.items():
-            if contact.get("adv_name", "").lower() == name.lower():
+        for contact in self._contacts.values():
+            if contact.get("adv_name", "").lower() == name:
                 return contact
 
         return None
@@ -373,6 +422,12 @@ class MeshCore:
 
         Returns:
             Contact dictionary or None if not found
+
+        Note:
+            Lookups go through an index built on each CONTACTS event. If the
+            prefix matches several contacts, or the contacts were changed
+            since then, the search falls back to a scan and returns the first
+            match in insertion order.
         """
         if not self._contacts or not prefix:
             return None
@@ -380,9 +435,23 @@ class MeshCore:
         # Convert the prefix to lowercase for case-insensitive matching
         prefix = prefix.lower()
 
-        for contact_id, contact in self._contacts.items():
-            public_key = contact.get("public_key", "").lower()
-            if public_key.startswith(prefix):
+        # Keys are sorted, so the first key not below the prefix is the only
+        # candidate that can start with it unless the prefix is ambiguous
+        index = self._contacts_by_key
+        i = bisect_left(index, prefix, key=itemgetter(0))
+        if (
+            i < len(index)
+            and index[i][0].startswith(prefix)
+            and not (i + 1 < len(index) and index[i + 1][0].startswith(prefix))
+        ):
+            contact = index[i][1]
+            if self._is_current_contact(contact) and contact.get(
+                "public_key", ""
+            ).lower().startswith(prefix):
+                return contact
+
+        for contact in self._contacts.values():
+            if contact.get("public_key", "").lower().startswith(prefix):
                 return contact
 
         return None
@@ -417,8 +486,8 @@ class MeshCore:
                         )
                         break
 
-                    # Small delay to prevent overwhelming the device
-                    await asyncio.sleep(0.1)
+                    # Yield to the event loop, the device paces replies itself
+                    await asyncio.sleep(0)
                 except Exception as e:
                     logger.error(f"Error fetching messages: {e}")
                     break
@@ -437,18 +506,13 @@ class MeshCore:
         """
         Stop automatically fetching messages when messages_waiting events are received.
         """
-        if hasattr(self, "_auto_fetch_subscription") and self._auto_fetch_subscription:
+        if self._auto_fetch_subscription is not None:
             self.unsubscribe(self._auto_fetch_subscription)
             self._auto_fetch_subscription = None
 
-        if hasattr(self, "_auto_fetch_running"):
-            self._auto_fetch_running = False
+        self._auto_fetch_running = False
 
-        if (
-            hasattr(self, "_auto_fetch_task")
-            and self._auto_fetch_task
-            and not self._auto_fetch_task.done()
-        ):
+        if self._auto_fetch_task is not None and not self._auto_fetch_task.done():
             self._auto_fetch_task.cancel()
             try:
                 await self._auto_fetch_task  # type: ignore
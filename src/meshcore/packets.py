@@ -1,8 +1,8 @@
-from enum import Enum
+from enum import IntEnum
 
 
 # Packet prefixes for the protocol
-class PacketType(Enum):
+class PacketType(IntEnum):
     OK = 0
     ERROR = 1
     CONTACT_START = 2
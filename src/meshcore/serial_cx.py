@@ -6,20 +6,18 @@ import asyncio
 import logging
 import serial_asyncio
 
+from .framing import _FRAME_HDR, _FrameParser
+
 # Get logger
 logger = logging.getLogger("meshcore")
 
 
-class SerialConnection:
+class SerialConnection(_FrameParser):
     def __init__(self, port, baudrate, cx_dly=0.2):
+        super().__init__()
         self.port = port
         self.baudrate = baudrate
-        self.frame_started = False
-        self.frame_size = 0
         self.transport = None
-        self.header = b""
-        self.reader = None
-        self.inframe = b""
         self._disconnect_callback = None
         self.cx_dly = cx_dly
         self._connected_event = asyncio.Event()
@@ -69,40 +67,13 @@ class SerialConnection:
         logger.info("Serial Connection started")
         return self.port
 
-    def set_reader(self, reader):
-        self.reader = reader
-
-    def handle_rx(self, data: bytearray):
-        headerlen = len(self.header)
-        framelen = len(self.inframe)
-        if not self.frame_started:  # wait start of frame
-            if len(data) >= 3 - headerlen:
-                self.header = self.header + data[: 3 - headerlen]
-                self.frame_started = True
-                self.frame_size = int.from_bytes(self.header[1:], byteorder="little")
-                self.handle_rx(data[3 - headerlen :])
-            else:
-                self.header = self.header + data
-        else:
-            if framelen + len(data) < self.frame_size:
-                self.inframe = self.inframe + data
-            else:
-                self.inframe = self.inframe + data[: self.frame_size - framelen]
-                if self.reader is not None:
-                    asyncio.create_task(self.reader.handle_rx(self.inframe))
-                self.frame_started = False
-                self.header = b""
-                self.inframe = b""
-                if framelen + len(data) > self.frame_size:
-                    self.handle_rx(data[self.frame_size - framelen :])
-
     async def send(self, data):
         if not self.transport:
             logger.error("Transport not connected, cannot send data")
             return
-        size = len(data)
-        pkt = b"\x3c" + size.to_bytes(2, byteorder="little") + data
-        logger.debug(f"sending pkt : {pkt}")
+        pkt = _FRAME_HDR.pack(0x3C, len(data)) + data
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"sending pkt : {pkt}")
         self.transport.write(pkt)
 
     async def disconnect(self):
@@ -5,6 +5,8 @@ mccli.py : CLI interface to MeschCore BLE companion app
 import asyncio
 import logging
 
+from .framing import _FRAME_HDR, _FrameParser
+
 # Get logger
 logger = logging.getLogger("meshcore")
 
@@ -12,15 +14,12 @@ logger = logging.getLogger("meshcore")
 TCP_DISCONNECT_THRESHOLD = 5
 
 
-class TCPConnection:
+class TCPConnection(_FrameParser):
     def __init__(self, host, port):
+        super().__init__()
         self.host = host
         self.port = port
         self.transport = None
-        self.frame_started = False
-        self.frame_size = 0
-        self.header = b""
-        self.inframe = b""
         self._disconnect_callback = None
         self._send_count = 0
         self._receive_count = 0
@@ -64,33 +63,6 @@ class TCPConnection:
 
         return future
 
-    def set_reader(self, reader):
-        self.reader = reader
-
-    def handle_rx(self, data: bytearray):
-        headerlen = len(self.header)
-        framelen = len(self.inframe)
-        if not self.frame_started:  # wait start of frame
-            if len(data) >= 3 - headerlen:
-                self.header = self.header + data[: 3 - headerlen]
-                self.frame_started = True
-                self.frame_size = int.from_bytes(self.header[1:], byteorder="little")
-                self.handle_rx(data[3 - headerlen :])
-            else:
-                self.header = self.header + data
-        else:
-            if framelen + len(data) < self.frame_size:
-                self.inframe = self.inframe + data
-            else:
-                self.inframe = self.inframe + data[: self.frame_size - framelen]
-                if self.reader is not None:
-                    asyncio.create_task(self.reader.handle_rx(self.inframe))
-                self.frame_started = False
-                self.header = b""
-                self.inframe = b""
-                if framelen + len(data) > self.frame_size:
-                    self.handle_rx(data[self.frame_size - framelen :])
-
     async def send(self, data):
         if not self.transport:
             logger.error("Transport not connected, cannot send data")
@@ -109,9 +81,9 @@ class TCPConnection:
                 await self._disconnect_callback("tcp_no_response")
             return
 
-        size = len(data)
-        pkt = b"\x3c" + size.to_bytes(2, byteorder="little") + data
-        logger.debug(f"sending pkt : {pkt}")
+        pkt = _FRAME_HDR.pack(0x3C, len(data)) + data
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"sending pkt : {pkt}")
         self.transport.write(pkt)
 
     async def disconnect(self):
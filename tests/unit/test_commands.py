@@ -2,6 +2,7 @@ import pytest
 import asyncio
 from unittest.mock import MagicMock, AsyncMock
 from meshcore.commands import CommandHandler
+from meshcore.commands.base import _hex_prefix, _validate_destination
 from meshcore.events import EventType, Event
 
 pytestmark = pytest.mark.asyncio
@@ -38,8 +39,10 @@ def command_handler(mock_connection, mock_dispatcher):
 
 # Test helper
 def setup_event_response(mock_dispatcher, event_type, payload, attribute_filters=None):
-    async def wait_response(requested_type, filters=None, timeout=None):
-        if requested_type == event_type:
+    async def wait_response(requested_types, filters=None, timeout=None):
+        if not isinstance(requested_types, (list, tuple)):
+            requested_types = [requested_types]
+        if event_type in requested_types:
             if filters and attribute_filters:
                 if not all(
                     attribute_filters.get(key) == value
@@ -79,6 +82,30 @@ async def test_send_timeout(command_handler, mock_connection, mock_dispatcher):
     assert result.payload == {"reason": "timeout"}
 
 
+async def test_send_bytearray_as_bytes(command_handler, mock_connection):
+    await command_handler.send(bytearray(b"test_data"))
+    sent = mock_connection.send.call_args[0][0]
+    assert type(sent) is bytes
+    assert sent == b"test_data"
+
+    mock_connection.reset_mock()
+    await command_handler.send_trace(path=bytearray(b"\x01\x02"))
+    assert type(mock_connection.send.call_args[0][0]) is bytes
+
+
+async def test_send_without_awaiting_response(
+    command_handler, mock_connection, mock_dispatcher
+):
+    result = await command_handler.send(
+        b"test_command", [EventType.OK, EventType.ERROR], await_response=False
+    )
+
+    mock_connection.send.assert_called_once_with(b"test_command")
+    mock_dispatcher.wait_for_event.assert_not_called()
+    assert result.type == EventType.OK
+    assert result.payload == {}
+
+
 # Destination validation tests
 async def test_validate_destination_bytes(command_handler, mock_connection):
     dst = b"123456789012"  # 12 bytes
@@ -104,6 +131,32 @@ async def test_validate_destination_contact_object(command_handler, mock_connect
     assert b"\x01\x23\x45\x67\x89\xab" in mock_connection.send.call_args[0][0]
 
 
+async def test_validate_destination_cache():
+    _hex_prefix.cache_clear()
+
+    contact = {"public_key": "0123456789abcdef"}
+    assert _validate_destination(contact) == b"\x01\x23\x45\x67\x89\xab"
+    assert _validate_destination("0123456789abcdef") == b"\x01\x23\x45\x67\x89\xab"
+    assert _hex_prefix.cache_info().hits == 1
+
+    # The prefix length is part of the cache key
+    assert _validate_destination(contact, prefix_length=8) == bytes.fromhex(
+        "0123456789abcdef"
+    )
+
+    with pytest.raises(ValueError, match="Invalid public key hex string"):
+        _validate_destination("not hex")
+    with pytest.raises(ValueError, match="Invalid public_key in contact"):
+        _validate_destination({"public_key": "zz"})
+
+
+async def test_validate_destination_bytes_fast_path():
+    key = bytes(range(32))
+    # Bytes already at the prefix length are returned as is
+    assert _validate_destination(key, prefix_length=32) is key
+    assert _validate_destination(key) == key[:6]
+
+
 # Command tests
 async def test_send_login(command_handler, mock_connection):
     await command_handler.send_login("0123456789abcdef", "password")
@@ -141,7 +194,32 @@ async def test_set_coords(command_handler, mock_connection):
     await command_handler.set_coords(37.7749, -122.4194)
 
     assert mock_connection.send.call_args[0][0].startswith(b"\x0e")
-    # Could add more detailed assertions for the byte encoding
+    assert mock_connection.send.call_args[0][0] == (
+        b"\x0e"
+        + int(37.7749 * 1e6).to_bytes(4, "little", signed=True)
+        + int(-122.4194 * 1e6).to_bytes(4, "little", signed=True)
+        + b"\x00\x00\x00\x00"
+    )
+
+
+async def test_set_radio(command_handler, mock_connection):
+    await command_handler.set_radio(869.525, 250, 11, 5)
+    assert mock_connection.send.call_args[0][0] == (
+        b"\x0b"
+        + (869525).to_bytes(4, "little")
+        + (250000).to_bytes(4, "little")
+        + b"\x0b\x05"
+    )
+
+
+async def test_send_chan_msg(command_handler, mock_connection):
+    await command_handler.send_chan_msg(2, "hi", timestamp=0x01020304)
+    assert mock_connection.send.call_args[0][0] == b"\x03\x00\x02\x04\x03\x02\x01hi"
+
+    # Raw timestamp bytes are still accepted
+    mock_connection.reset_mock()
+    await command_handler.send_chan_msg(2, "hi", timestamp=b"\x04\x03\x02\x01")
+    assert mock_connection.send.call_args[0][0] == b"\x03\x00\x02\x04\x03\x02\x01hi"
 
 
 async def test_send_appstart(command_handler, mock_connection):
@@ -231,6 +309,41 @@ async def test_remove_contact(command_handler, mock_connection):
     assert b"\x01\x23\x45\x67\x89\xab" in mock_connection.send.call_args[0][0]
 
 
+async def test_update_contact(command_handler, mock_connection):
+    contact = {
+        "public_key": "01" * 32,
+        "type": 1,
+        "flags": 0,
+        "out_path_len": -1,
+        "out_path": "",
+        "adv_name": "Bob",
+        "last_advert": 5,
+        "adv_lat": 1.5,
+        "adv_lon": -2.25,
+    }
+    await command_handler.change_contact_path(contact, "0a0b")
+
+    assert contact["out_path"] == "0a0b"
+    assert contact["out_path_len"] == 2
+    assert mock_connection.send.call_args[0][0] == (
+        b"\x09"
+        + b"\x01" * 32
+        + b"\x01\x00\x02"
+        + b"\x0a\x0b".ljust(64, b"\x00")
+        + b"Bob".ljust(32, b"\x00")
+        + (5).to_bytes(4, "little")
+        + (1500000).to_bytes(4, "little", signed=True)
+        + (-2250000).to_bytes(4, "little", signed=True)
+    )
+
+    # Flood path is kept as a signed length
+    mock_connection.reset_mock()
+    contact["out_path_len"] = -1
+    contact["out_path"] = ""
+    await command_handler.change_contact_flags(contact, 2)
+    assert mock_connection.send.call_args[0][0][33:36] == b"\x01\x02\xff"
+
+
 async def test_get_msg(command_handler, mock_connection):
     await command_handler.get_msg()
     assert mock_connection.send.call_args[0][0].startswith(b"\x0a")
@@ -270,6 +383,25 @@ async def test_send_trace(command_handler, mock_connection):
     assert second_call.startswith(b"\x24")
 
 
+async def test_send_trace_path_encoding(command_handler, mock_connection):
+    await command_handler.send_trace(auth_code=1, tag=2, flags=3, path="01,23, 45")
+    assert mock_connection.send.call_args[0][0] == (
+        b"\x24\x02\x00\x00\x00\x01\x00\x00\x00\x03\x01\x23\x45"
+    )
+
+    # Single digit values are still accepted
+    mock_connection.reset_mock()
+    await command_handler.send_trace(auth_code=1, tag=2, flags=3, path="1,a")
+    assert mock_connection.send.call_args[0][0].endswith(b"\x03\x01\x0a")
+
+    for bad_path in ("01,zz", "0102", "01 02", "0102,03"):
+        mock_connection.reset_mock()
+        result = await command_handler.send_trace(path=bad_path)
+        assert result.type == EventType.ERROR
+        assert result.payload == {"reason": "invalid_path_format"}
+        mock_connection.send.assert_not_called()
+
+
 async def test_send_with_multiple_expected_events_returns_first_completed(
     command_handler, mock_connection, mock_dispatcher
 ):
@@ -0,0 +1,58 @@
+import pytest
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+from meshcore.serial_cx import SerialConnection
+from meshcore.tcp_cx import TCPConnection
+
+pytestmark = pytest.mark.asyncio
+
+
+@pytest.fixture(params=["serial", "tcp"])
+def connection(request):
+    if request.param == "serial":
+        cx = SerialConnection("/dev/null", 115200)
+    else:
+        cx = TCPConnection("localhost", 5000)
+    reader = MagicMock()
+    reader.handle_rx = AsyncMock()
+    cx.set_reader(reader)
+    return cx
+
+
+async def received_frames(cx):
+    # Frames are handed to the reader in tasks, let them run
+    await asyncio.sleep(0)
+    return [bytes(call.args[0]) for call in cx.reader.handle_rx.call_args_list]
+
+
+def frame(payload):
+    return b"\x3e" + len(payload).to_bytes(2, "little") + payload
+
+
+async def test_frame_split_across_reads(connection):
+    data = frame(b"\x05" + bytes(range(60)))
+    for i in range(0, len(data), 7):
+        connection.handle_rx(data[i : i + 7])
+
+    assert await received_frames(connection) == [b"\x05" + bytes(range(60))]
+
+
+async def test_several_frames_in_one_read(connection):
+    connection.handle_rx(frame(b"\x00") + frame(b"\x01\x02") + frame(b"\x83")[:2])
+    connection.handle_rx(frame(b"\x83")[2:])
+
+    assert await received_frames(connection) == [b"\x00", b"\x01\x02", b"\x83"]
+
+
+async def test_empty_frame_is_skipped(connection):
+    connection.handle_rx(frame(b"") + frame(b"\x0a"))
+
+    assert await received_frames(connection) == [b"\x0a"]
+    assert not connection.frame_started
+
+
+async def test_send_frames_payload(connection):
+    connection.transport = MagicMock()
+    await connection.send(b"\x16\x03")
+
+    connection.transport.write.assert_called_once_with(b"\x3c\x02\x00\x16\x03")
@@ -104,6 +104,52 @@ async def test_wait_for_event_timeout_with_filter(dispatcher):
         await dispatcher.stop()
 
 
+async def test_wait_for_any_of_several_events(dispatcher):
+    await dispatcher.start()
+
+    try:
+        future_event = asyncio.create_task(
+            dispatcher.wait_for_event([EventType.OK, EventType.ERROR], timeout=3.0)
+        )
+
+        await asyncio.sleep(0.1)
+
+        await dispatcher.dispatch(Event(EventType.ERROR, {"error_code": 1}))
+
+        result = await asyncio.wait_for(future_event, 3.0)
+
+        assert result is not None
+        assert result.type == EventType.ERROR
+        assert result.payload == {"error_code": 1}
+
+        # Every temporary subscription is removed once the wait is over
+        assert dispatcher.subscriptions == []
+
+    finally:
+        await dispatcher.stop()
+
+
+async def test_dispatch_type_only_queues_when_subscribed(dispatcher):
+    await dispatcher.dispatch_type(EventType.MESSAGES_WAITING)
+    assert dispatcher.queue.empty()
+
+    callback = MagicMock()
+    dispatcher.subscribe(EventType.MESSAGES_WAITING, callback)
+    await dispatcher.start()
+
+    try:
+        await dispatcher.dispatch_type(EventType.MESSAGES_WAITING)
+        await asyncio.sleep(0.1)
+
+        callback.assert_called_once()
+        event = callback.call_args[0][0]
+        assert event.type == EventType.MESSAGES_WAITING
+        assert event.payload == {}
+
+    finally:
+        await dispatcher.stop()
+
+
 async def test_event_init_with_kwargs():
     # Test creating an event with keyword attributes
     event = Event(EventType.ACK, {"data": "value"}, code="1234", status="ok")
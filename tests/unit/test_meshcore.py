@@ -0,0 +1,73 @@
+import pytest
+from unittest.mock import MagicMock
+from meshcore.meshcore import MeshCore
+
+
+@pytest.fixture
+def meshcore():
+    return MeshCore(MagicMock())
+
+
+def set_contacts(mc, contacts):
+    mc._contacts = {c["public_key"]: c for c in contacts}
+    mc._index_contacts()
+
+
+def test_get_contact_by_name(meshcore):
+    assert meshcore.get_contact_by_name("alice") is None
+
+    alice = {"public_key": "aa01", "adv_name": "Alice"}
+    bob = {"public_key": "bb02", "adv_name": "Bob"}
+    set_contacts(meshcore, [alice, bob])
+
+    assert meshcore.get_contact_by_name("alice") is alice
+    assert meshcore.get_contact_by_name("BOB") is bob
+    assert meshcore.get_contact_by_name("carol") is None
+
+
+def test_get_contact_by_key_prefix(meshcore):
+    assert meshcore.get_contact_by_key_prefix("aa") is None
+
+    set_contacts(
+        meshcore,
+        [
+            {"public_key": "bb02ff", "adv_name": "Bob"},
+            {"public_key": "AA01ff", "adv_name": "Alice"},
+            {"public_key": "cc03ff", "adv_name": "Carol"},
+        ],
+    )
+
+    assert meshcore.get_contact_by_key_prefix("aa")["adv_name"] == "Alice"
+    assert meshcore.get_contact_by_key_prefix("BB02")["adv_name"] == "Bob"
+    assert meshcore.get_contact_by_key_prefix("cc03ff")["adv_name"] == "Carol"
+    assert meshcore.get_contact_by_key_prefix("ab") is None
+    assert meshcore.get_contact_by_key_prefix("dd") is None
+    assert meshcore.get_contact_by_key_prefix("") is None
+
+
+def test_contact_lookup_follows_live_contacts(meshcore):
+    alice = {"public_key": "aa01", "adv_name": "Alice"}
+    set_contacts(meshcore, [alice])
+
+    # Swap one contact for another so the count stays the same
+    bob = {"public_key": "bb02", "adv_name": "Bob"}
+    del meshcore.contacts[alice["public_key"]]
+    meshcore.contacts[bob["public_key"]] = bob
+
+    assert meshcore.get_contact_by_name("bob") is bob
+    assert meshcore.get_contact_by_key_prefix("bb") is bob
+    assert meshcore.get_contact_by_name("alice") is None
+    assert meshcore.get_contact_by_key_prefix("aa") is None
+
+    bob["adv_name"] = "Robert"
+    assert meshcore.get_contact_by_name("bob") is None
+    assert meshcore.get_contact_by_name("robert") is bob
+
+
+def test_contact_lookup_ambiguous_prefix_keeps_insertion_order(meshcore):
+    later = {"public_key": "aa02", "adv_name": "Later"}
+    first = {"public_key": "aa09", "adv_name": "First"}
+    set_contacts(meshcore, [first, later])
+
+    assert meshcore.get_contact_by_key_prefix("aa") is first
+    assert meshcore.get_contact_by_key_prefix("aa02") is later
@@ -0,0 +1,197 @@
+import pytest
+import struct
+from unittest.mock import AsyncMock, MagicMock
+from meshcore.events import EventType
+from meshcore.reader import MessageReader
+
+pytestmark = pytest.mark.asyncio
+
+
+@pytest.fixture
+def dispatcher():
+    dispatcher = MagicMock()
+    dispatcher.dispatch = AsyncMock()
+    return dispatcher
+
+
+@pytest.fixture
+def reader(dispatcher):
+    return MessageReader(dispatcher)
+
+
+def dispatched(dispatcher):
+    return [call.args[0] for call in dispatcher.dispatch.call_args_list]
+
+
+def contact_packet(code=3, path=b"\x11\x22", name=b"Alice"):
+    return (
+        bytes([code])
+        + bytes(range(32))
+        + bytes([1, 2, len(path) if path else 0xFF])
+        + path.ljust(64, b"\x00")
+        + name.ljust(32, b"\x00")
+        + struct.pack("<IiiI", 1700000000, 45500000, -73250000, 1700000100)
+    )
+
+
+async def test_ok_with_value(reader, dispatcher):
+    await reader.handle_rx(bytearray(b"\x00\x2a\x00\x00\x00"))
+
+    (event,) = dispatched(dispatcher)
+    assert event.type == EventType.OK
+    assert event.payload == {"value": 42}
+
+
+async def test_unknown_packet_is_ignored(reader, dispatcher):
+    await reader.handle_rx(bytearray(b"\x7f\x01\x02"))
+
+    dispatcher.dispatch.assert_not_called()
+
+
+async def test_contact_list(reader, dispatcher):
+    await reader.handle_rx(bytearray(b"\x02\x01\x00\x00\x00"))
+    await reader.handle_rx(bytearray(contact_packet()))
+    await reader.handle_rx(bytearray(b"\x04\x64\x00\x00\x00"))
+
+    (event,) = dispatched(dispatcher)
+    assert event.type == EventType.CONTACTS
+    assert event.attributes == {"lastmod": 100}
+
+    contact = event.payload[bytes(range(32)).hex()]
+    assert contact == {
+        "public_key": bytes(range(32)).hex(),
+        "type": 1,
+        "flags": 2,
+        "out_path_len": 2,
+        "out_path": "1122",
+        "adv_name": "Alice",
+        "last_advert": 1700000000,
+        "adv_lat": 45.5,
+        "adv_lon": -73.25,
+        "lastmod": 1700000100,
+    }
+
+
+async def test_new_advert_flood_path(reader, dispatcher):
+    await reader.handle_rx(bytearray(contact_packet(code=0x8A, path=b"")))
+
+    (event,) = dispatched(dispatcher)
+    assert event.type == EventType.NEW_CONTACT
+    assert event.payload["out_path_len"] == -1
+    assert event.payload["out_path"] == ""
+
+
+async def test_msg_sent(reader, dispatcher):
+    await reader.handle_rx(bytearray(b"\x06\x01\xde\xad\xbe\xef\x88\x13\x00\x00"))
+
+    (event,) = dispatched(dispatcher)
+    assert event.type == EventType.MSG_SENT
+    assert event.payload == {
+        "type": 1,
+        "expected_ack": b"\xde\xad\xbe\xef",
+        "suggested_timeout": 5000,
+    }
+    assert event.attributes == {"type": 1, "expected_ack": "deadbeef"}
+
+
+async def test_status_response(reader, dispatcher):
+    values = (4200, 3, -110, -95) + tuple(range(1, 9)) + (7, -22, 5, 6, 1234)
+    packet = b"\x87\x00" + bytes.fromhex("a1b2c3d4e5f6")
+    packet += struct.pack("<HHhhIIIIIIIIHhHHI", *values)
+    await reader.handle_rx(bytearray(packet))
+
+    (event,) = dispatched(dispatcher)
+    assert event.type == EventType.STATUS_RESPONSE
+    assert event.attributes == {"pubkey_prefix": "a1b2c3d4e5f6"}
+    assert event.payload == {
+        "pubkey_pre": "a1b2c3d4e5f6",
+        "bat": 4200,
+        "tx_queue_len": 3,
+        "noise_floor": -110,
+        "last_rssi": -95,
+        "nb_recv": 1,
+        "nb_sent": 2,
+        "airtime": 3,
+        "uptime": 4,
+        "sent_flood": 5,
+        "sent_direct": 6,
+        "recv_flood": 7,
+        "recv_direct": 8,
+        "full_evts": 7,
+        "last_snr": -5.5,
+        "direct_dups": 5,
+        "flood_dups": 6,
+        "rx_airtime": 1234,
+    }
+
+
+async def test_contact_msg_recv_v3(reader, dispatcher):
+    packet = (
+        b"\x10\xf6\x00\x00"
+        + bytes.fromhex("a1b2c3d4e5f6")
+        + b"\x02\x00"
+        + struct.pack("<I", 1700000000)
+        + "héllo".encode("utf-8")
+    )
+    await reader.handle_rx(bytearray(packet))
+
+    (event,) = dispatched(dispatcher)
+    assert event.type == EventType.CONTACT_MSG_RECV
+    assert event.payload == {
+        "type": "PRIV",
+        "SNR": -2.5,
+        "pubkey_prefix": "a1b2c3d4e5f6",
+        "path_len": 2,
+        "txt_type": 0,
+        "sender_timestamp": 1700000000,
+        "text": "héllo",
+    }
+    assert event.attributes == {"pubkey_prefix": "a1b2c3d4e5f6", "txt_type": 0}
+
+
+async def test_device_info_strings(reader, dispatcher):
+    packet = (
+        b"\x0d\x08\x32\x08"
+        + struct.pack("<I", 123456)
+        + b"12 Jun 2025".ljust(12, b"\x00")
+        + b"Heltec V3\x00junk".ljust(40, b"\x00")
+        + b"v1.7.0".ljust(20, b"\x00")
+    )
+    await reader.handle_rx(bytearray(packet))
+
+    (event,) = dispatched(dispatcher)
+    assert event.type == EventType.DEVICE_INFO
+    assert event.payload == {
+        "fw ver": 8,
+        "max_contacts": 100,
+        "max_channels": 8,
+        "ble_pin": 123456,
+        "fw_build": "12 Jun 2025",
+        "model": "Heltec V3",
+        "ver": "v1.7.0",
+    }
+
+
+async def test_current_time_and_battery(reader, dispatcher):
+    await reader.handle_rx(bytearray(b"\x09" + struct.pack("<I", 1700000000)))
+    await reader.handle_rx(bytearray(b"\x0c\x10\x0e"))
+
+    time_event, battery_event = dispatched(dispatcher)
+    assert time_event.type == EventType.CURRENT_TIME
+    assert time_event.payload == {"time": 1700000000}
+    assert battery_event.type == EventType.BATTERY
+    assert battery_event.payload == {"level": 3600}
+
+
+async def test_short_fixed_width_frames(reader, dispatcher):
+    await reader.handle_rx(bytearray(b"\x02\x03"))
+    await reader.handle_rx(bytearray(b"\x04\x64"))
+    await reader.handle_rx(bytearray(b"\x09\x10\x0e"))
+    await reader.handle_rx(bytearray(b"\x0c\x64"))
+
+    assert reader.contact_nb == 3
+    contacts_event, time_event, battery_event = dispatched(dispatcher)
+    assert contacts_event.type == EventType.CONTACTS
+    assert contacts_event.attributes == {"lastmod": 100}
+    assert time_event.payload == {"time": 3600}
+    assert battery_event.payload == {"level": 100}